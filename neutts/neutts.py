@@ -9,7 +9,7 @@ import re
 import warnings
 from neucodec import NeuCodec, DistillNeuCodec
 from transformers import AutoTokenizer, AutoModelForCausalLM
-from .phonemizers import BasePhonemizer, CUSTOM_PHONEMIZERS
+from .phonemizers import BasePhonemizer, CUSTOM_PHONEMIZERS, get_phonemizer
 
 
 BACKBONE_LANGUAGE_MAP = {
@@ -127,7 +127,7 @@ class NeuTTS:
                 )
 
         if language in CUSTOM_PHONEMIZERS:
-            self.phonemizer = CUSTOM_PHONEMIZERS[language]
+            self.phonemizer = get_phonemizer(language)
         else:
             self.phonemizer = BasePhonemizer(language_code=language)
 
@@ -306,8 +306,8 @@ class NeuTTS:
             raise ValueError("No valid speech tokens found in the output.")
 
     def _to_phones(self, text: str) -> str:
-        phones = self.phonemizer.phonemize([text])
-        phones = phones[0].split()
+        phones = self.phonemizer.phonemize(text)
+        phones = phones.split()
         phones = " ".join(phones)
         return phones
 
@@ -1,16 +1,51 @@
+from collections.abc import Mapping
 from typing import Union, List
 from phonemizer.backend import EspeakBackend
+import functools
 import platform
-import glob
 import os
+import re
+import threading
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=1)
 def _configure_espeak_library() -> bool:
+    """Run `_locate_espeak_library` once and return its (cached) result."""
+    return _locate_espeak_library()
+
+
+# Homebrew installs arm64 bottles under /opt/homebrew and x86_64 ones under /usr/local;
+# only the Cellar matching this interpreter's architecture has loadable libraries.
+_HOMEBREW_CELLARS = (Path("/opt/homebrew/Cellar"), Path("/usr/local/Cellar"))
+_NATIVE_CELLAR = _HOMEBREW_CELLARS[0] if platform.machine() == "arm64" else _HOMEBREW_CELLARS[1]
+
+
+def _cellar_library_sort_key(lib_path: Path, native_cellar: Path = _NATIVE_CELLAR) -> tuple:
+    """Sort key (highest is best) for `<Cellar>/<formula>/<version>/lib/<library>` paths.
+
+    Ranks the native Cellar first, then espeak-ng over legacy espeak, then `--HEAD`
+    builds over releases, then the newest release. Only the version directory is
+    parsed, so the library soname (e.g. `.1.dylib`) doesn't affect the order.
+    """
+    version_dir = lib_path.parent.parent.name
+    is_head = version_dir.startswith("HEAD")
+    version = () if is_head else tuple(int(v) for v in re.findall(r"\d+", version_dir))
+    return (
+        lib_path.parents[3] == native_cellar,
+        lib_path.name.startswith("libespeak-ng"),
+        is_head,
+        version,
+    )
+
+
+def _locate_espeak_library() -> bool:
     """Configure phonemizer to use the espeak-ng bundled with this package.
 
-    Falls back to system/Homebrew espeak-ng if the bundled version is not present
-    (e.g. when running from a source checkout without building).
+    Falls back, in order, to a neutts wheel in site-packages, espeakng-loader and (on
+    macOS) Homebrew espeak-ng if the bundled version is not present (e.g. when running
+    from a source checkout without building). The last two are skipped if the user has
+    set PHONEMIZER_ESPEAK_LIBRARY, and a user-set ESPEAK_DATA_PATH is left alone.
 
     Returns True if the bundled version was loaded, False if a system fallback was used.
     """
@@ -72,23 +107,39 @@ def _configure_espeak_library() -> bool:
     except Exception:
         pass
 
-    # Fallback 2: search common Homebrew/system paths on macOS
+    # Don't override a library the user has already pointed phonemizer at
+    if os.environ.get("PHONEMIZER_ESPEAK_LIBRARY"):
+        return False
+
+    # Fallback 2: use the library shipped by espeakng-loader, if installed. This avoids
+    # scanning system paths and works the same on every platform.
+    try:
+        import espeakng_loader
+        from phonemizer.backend.espeak.wrapper import EspeakWrapper
+
+        EspeakWrapper.set_library(espeakng_loader.get_library_path())
+        os.environ.setdefault("ESPEAK_DATA_PATH", espeakng_loader.get_data_path())
+        return False
+    except Exception:
+        pass
+
+    # Fallback 3: search common Homebrew/system paths on macOS
     if platform.system() == "Darwin":
-        search_paths = [
-            "/opt/homebrew/Cellar/espeak-ng/*/lib/libespeak-ng.*.dylib",
-            "/usr/local/Cellar/espeak-ng/*/lib/libespeak-ng.*.dylib",
-            "/opt/homebrew/Cellar/espeak/*/lib/libespeak.*.dylib",
-            "/usr/local/Cellar/espeak/*/lib/libespeak.*.dylib",
-        ]
-        for pattern in search_paths:
-            matches = glob.glob(pattern)
-            if matches:
-                try:
-                    from phonemizer.backend.espeak.wrapper import EspeakWrapper
-                    EspeakWrapper.set_library(matches[0])
-                except Exception:
-                    pass
-                break
+        # One walk per Cellar covers both the espeak-ng and legacy espeak formulae
+        matches = []
+        for cellar in _HOMEBREW_CELLARS:
+            matches.extend(cellar.glob("espeak*/*/lib/libespeak*.*.dylib"))
+
+        # Prefer the native Cellar, then espeak-ng over legacy espeak, then the newest
+        # installed version, so the choice doesn't depend on filesystem ordering
+        matches.sort(key=_cellar_library_sort_key, reverse=True)
+        if matches:
+            try:
+                from phonemizer.backend.espeak.wrapper import EspeakWrapper
+
+                EspeakWrapper.set_library(str(matches[0]))
+            except Exception:
+                pass
 
     return False
 
@@ -97,22 +148,63 @@ def _configure_espeak_library() -> bool:
 _using_bundled_espeak = _configure_espeak_library()
 
 
+# Constructing an EspeakBackend is slow (it loads a private copy of the espeak-ng
+# library and its voice data), so backends are shared between phonemizers with the
+# same settings. espeak-ng keeps global state per loaded library, so each cached
+# backend comes with a lock that must be held around every call into it.
+_BACKEND_CACHE: dict[tuple, tuple[EspeakBackend, threading.Lock]] = {}
+_BACKEND_CACHE_LOCK = threading.Lock()
+
+
+def _get_espeak_backend(
+    language: str,
+    preserve_punctuation: bool = True,
+    with_stress: bool = True,
+    words_mismatch: str = "ignore",
+    language_switch: str = "remove-flags",
+    warmup: bool = True,
+) -> tuple[EspeakBackend, threading.Lock]:
+    key = (language, preserve_punctuation, with_stress, words_mismatch, language_switch)
+    with _BACKEND_CACHE_LOCK:
+        entry = _BACKEND_CACHE.get(key)
+        if entry is not None:
+            return entry
+
+        backend = EspeakBackend(
+            language=language,
+            preserve_punctuation=preserve_punctuation,
+            with_stress=with_stress,
+            words_mismatch=words_mismatch,
+            language_switch=language_switch,
+        )
+        entry = _BACKEND_CACHE[key] = (backend, threading.Lock())
+        # Hold the new backend's own lock for the warm-up, so other phonemizers for this
+        # language wait for it while backends for other languages can still be built.
+        backend_lock = entry[1]
+        backend_lock.acquire()
+
+    try:
+        # EspeakBackend.__init__ has already loaded the voice and dictionary; a dummy
+        # call warms the remaining first-call path (espeak translation setup and
+        # phonemizer's per-call scaffolding) off the inference critical path.
+        if warmup and os.environ.get("NEUTTS_PHONEMIZER_NO_WARMUP") != "1":
+            backend.phonemize(["a"])
+    finally:
+        backend_lock.release()
+    return entry
+
+
 class BasePhonemizer:
 
-    def __init__(self, language_code: str = None):
+    def __init__(self, language_code: str = None, warmup: bool = True, cache: bool = True):
         self.code = language_code
+        self.cache = cache
         if not self.code:
             raise ValueError(
                 "A language code must be provided either via argument or subclass default"
             )
 
-        self.g2p = EspeakBackend(
-            language=self.code,
-            preserve_punctuation=True,
-            with_stress=True,
-            words_mismatch="ignore",
-            language_switch="remove-flags",
-        )
+        self.g2p, self._g2p_lock = _get_espeak_backend(self.code, warmup=warmup)
 
         self.espeak_version = self.g2p.version()  # returns (major, minor, patch)
 
@@ -125,6 +217,16 @@ class BasePhonemizer:
                 "To use the correct version, reinstall the package via pip: pip install neutts\n"
             )
 
+    # Used to skip the per-text Python loops when a hook is the base identity. Checked at
+    # call time so hooks assigned on an instance are honoured, not just subclass overrides.
+    @property
+    def _has_preprocess(self) -> bool:
+        return getattr(self.preprocess, "__func__", None) is not BasePhonemizer.preprocess
+
+    @property
+    def _has_clean(self) -> bool:
+        return getattr(self.clean, "__func__", None) is not BasePhonemizer.clean
+
     def preprocess(self, text: str) -> str:
         """Language-specific text preprocessing."""
         return text
@@ -133,30 +235,92 @@ class BasePhonemizer:
         """Language-specific phoneme cleanup."""
         return phonemes
 
-    def phonemize(self, text: Union[str, List[str]]) -> Union[str, List[str]]:
-        """Phonemize text (or list of texts), then clean the output."""
-        single_input = False
+    def phonemize(self, text: Union[str, List[str]], njobs: int = 1) -> Union[str, List[str]]:
+        """Phonemize text (or list of texts), then clean the output.
+
+        Unless constructed with `cache=False`, results for single texts are memoised
+        (see `clear_cache`), since the same reference text is typically phonemized on
+        every inference call. Cached entries keep their phonemizer alive until evicted.
+        For lists,
+        `njobs` > 1 splits the batch across phonemizer's worker processes (espeak-ng
+        is not thread-safe, so threads sharing one backend are not an option). Each
+        worker reloads espeak-ng, so this only pays off for large batches.
+        """
         if isinstance(text, str):
-            text = [text]
-            single_input = True
+            if self.cache:
+                return _phonemize_one(self, text)
+            return self._phonemize_uncached(text)
+
+        if self._has_preprocess:
+            text = [self.preprocess(t) for t in text]
 
-        preprocessed_text = [self.preprocess(t) for t in text]
-        phonemes_list = self.g2p.phonemize(preprocessed_text)
-        cleaned_list = [self.clean(p) for p in phonemes_list]
+        with self._g2p_lock:
+            phonemes_list = self.g2p.phonemize(text, njobs=max(1, min(njobs, len(text))))
 
-        return cleaned_list[0] if single_input else cleaned_list
+        if self._has_clean:
+            return [self.clean(p) for p in phonemes_list]
+        return phonemes_list
+
+    def _phonemize_uncached(self, text: str) -> str:
+        if self._has_preprocess:
+            text = self.preprocess(text)
+        with self._g2p_lock:
+            phonemes = self.g2p.phonemize([text])[0]
+        return self.clean(phonemes) if self._has_clean else phonemes
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all memoised single-text phonemization results."""
+        _phonemize_one.cache_clear()
+
+
+@functools.lru_cache(maxsize=1024)
+def _phonemize_one(phonemizer: BasePhonemizer, text: str) -> str:
+    # Keyed by phonemizer identity (not just language) as subclasses clean differently;
+    # holding the instance in the key also rules out id() reuse after garbage collection.
+    return phonemizer._phonemize_uncached(text)
 
 
 class FrenchPhonemizer(BasePhonemizer):
 
-    def __init__(self, language_code: str = "fr-fr"):
-        super().__init__(language_code)
+    def __init__(self, language_code: str = "fr-fr", warmup: bool = True, cache: bool = True):
+        super().__init__(language_code, warmup=warmup, cache=cache)
 
     def clean(self, phonemes: str) -> str:
         # Remove dashes (common in french output - indicates syllable, but not needed)
         return phonemes.replace("-", "")
 
 
-CUSTOM_PHONEMIZERS = {
-    "fr-fr": FrenchPhonemizer(),
+# Language-specific phonemizers, constructed lazily on first use so that importing this
+# module does not pay for espeak backends of languages that are never requested.
+_PHONEMIZER_FACTORIES = {
+    "fr-fr": FrenchPhonemizer,
 }
+_PHONEMIZER_CACHE = {}
+
+
+def get_phonemizer(code: str) -> BasePhonemizer:
+    """Return the (cached) custom phonemizer registered for `code`."""
+    if code not in _PHONEMIZER_CACHE:
+        _PHONEMIZER_CACHE[code] = _PHONEMIZER_FACTORIES[code]()
+    return _PHONEMIZER_CACHE[code]
+
+
+class _LazyPhonemizerMap(Mapping):
+    """Read-only mapping of language code -> phonemizer, instantiated on access."""
+
+    def __getitem__(self, code: str) -> BasePhonemizer:
+        return get_phonemizer(code)
+
+    def __iter__(self):
+        return iter(_PHONEMIZER_FACTORIES)
+
+    def __len__(self) -> int:
+        return len(_PHONEMIZER_FACTORIES)
+
+    def __contains__(self, code) -> bool:
+        return code in _PHONEMIZER_FACTORIES
+
+
+# Kept for backwards compatibility; prefer `get_phonemizer`.
+CUSTOM_PHONEMIZERS = _LazyPhonemizerMap()
@@ -1,8 +1,19 @@
 import os
+import subprocess
+import sys
+from pathlib import Path
 import torch
 import numpy as np
 import pytest
 from neutts import NeuTTS, BACKBONE_LANGUAGE_MAP
+from neutts import phonemizers
+from neutts.phonemizers import (
+    CUSTOM_PHONEMIZERS,
+    BasePhonemizer,
+    _cellar_library_sort_key,
+    _phonemize_one,
+    get_phonemizer,
+)
 
 
 _ALL_BACKBONES = list(BACKBONE_LANGUAGE_MAP.keys())
@@ -29,6 +40,148 @@ def reference_data() -> tuple[torch.Tensor, str]:
     return ref_codes, ref_text
 
 
+@pytest.fixture()
+def stub_backend(monkeypatch) -> list:
+    """Replace EspeakBackend with a stub (no espeak needed); yields the backends built."""
+    created = []
+
+    class _StubBackend:
+        def __init__(self, language, **kwargs):
+            self.language = language
+            self.calls = []
+            created.append(self)
+
+        def version(self):
+            return (1, 52, 0)
+
+        def phonemize(self, text, njobs=1):
+            self.calls.append(list(text))
+            return [f"{self.language}:{t}" for t in text]
+
+    monkeypatch.setattr(phonemizers, "EspeakBackend", _StubBackend)
+    monkeypatch.setattr(phonemizers, "_BACKEND_CACHE", {})
+    monkeypatch.setattr(phonemizers, "_PHONEMIZER_CACHE", {})
+    monkeypatch.setattr(phonemizers, "_using_bundled_espeak", True)
+    monkeypatch.delenv("NEUTTS_PHONEMIZER_NO_WARMUP", raising=False)
+    BasePhonemizer.clear_cache()
+    yield created
+    BasePhonemizer.clear_cache()
+
+
+def test_instance_hooks_are_honoured(stub_backend):
+    phonemizer = BasePhonemizer(language_code="en-us")
+    phonemizer.preprocess = lambda text: text.lower()
+    phonemizer.clean = lambda phonemes: phonemes + "!"
+
+    assert phonemizer.phonemize("Hi") == "en-us:hi!"
+    assert phonemizer.phonemize(["Hi"]) == ["en-us:hi!"]
+
+
+def test_custom_phonemizers_import_builds_nothing():
+    # In a fresh interpreter, with EspeakBackend unusable, so any eager construction fails
+    code = (
+        "import phonemizer.backend; phonemizer.backend.EspeakBackend = None; "
+        "from neutts import phonemizers; "
+        "assert 'fr-fr' in phonemizers.CUSTOM_PHONEMIZERS; "
+        "assert not phonemizers._PHONEMIZER_CACHE and not phonemizers._BACKEND_CACHE"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_custom_phonemizers_are_lazy(stub_backend):
+    assert "fr-fr" in CUSTOM_PHONEMIZERS
+    assert list(CUSTOM_PHONEMIZERS) == ["fr-fr"]
+    assert stub_backend == []
+
+    assert CUSTOM_PHONEMIZERS["fr-fr"] is get_phonemizer("fr-fr")
+    assert len(stub_backend) == 1
+
+    with pytest.raises(KeyError):
+        CUSTOM_PHONEMIZERS["xx"]
+    with pytest.raises(KeyError):
+        get_phonemizer("xx")
+
+
+@pytest.mark.parametrize("cache", [True, False])
+def test_phonemize_cache_opt_out(stub_backend, cache):
+    phonemizer = BasePhonemizer(language_code="en-us", warmup=False, cache=cache)
+    (backend,) = stub_backend
+
+    assert phonemizer.phonemize("Hi") == "en-us:Hi"
+    assert phonemizer.phonemize("Hi") == "en-us:Hi"
+    assert len(backend.calls) == (1 if cache else 2)
+    assert _phonemize_one.cache_info().currsize == (1 if cache else 0)
+
+
+_ARM_CELLAR = Path("/opt/homebrew/Cellar")
+
+
+@pytest.mark.parametrize(
+    "better, worse",
+    [
+        # Newest release wins, compared numerically and ignoring the soname
+        ("espeak-ng/1.52.0/lib/libespeak-ng.1.dylib", "espeak-ng/1.51.1/lib/libespeak-ng.2.dylib"),
+        ("espeak-ng/1.10.0/lib/libespeak-ng.1.dylib", "espeak-ng/1.9.0/lib/libespeak-ng.1.dylib"),
+        # espeak-ng wins over a newer-looking legacy espeak
+        ("espeak-ng/1.50/lib/libespeak-ng.1.dylib", "espeak/1.48.04_1/lib/libespeak.1.dylib"),
+        # --HEAD builds win over releases
+        (
+            "espeak-ng/HEAD-1a2b3c4/lib/libespeak-ng.1.dylib",
+            "espeak-ng/1.52.0/lib/libespeak-ng.1.dylib",
+        ),
+    ],
+)
+def test_cellar_library_sort_key(better, worse):
+    key = _cellar_library_sort_key
+    assert key(_ARM_CELLAR / better, _ARM_CELLAR) > key(_ARM_CELLAR / worse, _ARM_CELLAR)
+
+
+def test_cellar_library_sort_key_prefers_native_cellar():
+    native = _ARM_CELLAR / "espeak-ng/1.51/lib/libespeak-ng.1.dylib"
+    foreign = Path("/usr/local/Cellar/espeak-ng/1.52.0/lib/libespeak-ng.1.dylib")
+    key = _cellar_library_sort_key
+    assert key(native, _ARM_CELLAR) > key(foreign, _ARM_CELLAR)
+
+
+def test_single_phonemizers_module():
+    # Importing neutts through several paths would configure espeak more than once
+    modules = [name for name in sys.modules if name.rsplit(".", 1)[-1] == "phonemizers"]
+    assert modules == ["neutts.phonemizers"]
+
+
+def test_backends_are_shared_per_language(stub_backend):
+    first = BasePhonemizer(language_code="en-us")
+    second = BasePhonemizer(language_code="en-us")
+    other = BasePhonemizer(language_code="es")
+
+    assert first.g2p is second.g2p
+    assert first._g2p_lock is second._g2p_lock
+    assert other.g2p is not first.g2p
+    assert other._g2p_lock is not first._g2p_lock
+    assert [backend.language for backend in stub_backend] == ["en-us", "es"]
+
+
+@pytest.mark.parametrize("warmup", [True, False])
+def test_warmup_only_for_new_backends(stub_backend, warmup):
+    BasePhonemizer(language_code="en-us", warmup=warmup)
+    BasePhonemizer(language_code="en-us", warmup=warmup)
+
+    (backend,) = stub_backend
+    assert backend.calls == ([["a"]] if warmup else [])
+
+
+def test_phonemize_cache():
+    BasePhonemizer.clear_cache()
+    phonemizer = BasePhonemizer(language_code="en-us")
+
+    phones = phonemizer.phonemize("Testing.")
+    assert phonemizer.phonemize("Testing.") == phones
+    assert _phonemize_one.cache_info().hits == 1
+
+    # The uncached batch path must agree with the memoised single-text path
+    assert phonemizer.phonemize(["Testing."]) == [phones]
+
+
 def _run_inference_test(backbone, codec, reference_data):
     """Loads a backbone+codec pair and validates the audio output."""
     ref_codes, ref_text = reference_data